@@ -1,10 +1,7 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import os
 import time
-import numpy as np
 
 # --- Importação da lógica do usuário ---
 try:
@@ -94,14 +91,9 @@ if page == "Análise de Dados (EDA)":
     st.write(df_filtered[['Valor', 'Peso', 'Ratio']].describe())
 
     st.subheader("Distribuições e Relações")
-    fig, ax = plt.subplots(1, 3, figsize=(18, 5))
-    sns.histplot(df_filtered['Valor'], kde=True, ax=ax[0], color='blue')
-    ax[0].set_title("Distribuição de Valor")
-    sns.histplot(df_filtered['Peso'], kde=True, ax=ax[1], color='red')
-    ax[1].set_title("Distribuição de Peso")
-    sns.scatterplot(df_filtered, x="Peso", y="Valor", hue="Ratio", ax=ax[2])
-    ax[2].set_title("Peso vs Valor (Cor = Ratio)")
-    st.pyplot(fig)
+    # Importação tardia: matplotlib/seaborn só são carregados nas páginas com gráficos
+    from src.plotting import plot_distribuicoes
+    st.pyplot(plot_distribuicoes(df_filtered))
 
     st.subheader("Tabela de Dados Filtrada")
     st.data_editor(df_filtered)
@@ -175,9 +167,5 @@ elif page == "Análise de Sensibilidade":
     st.subheader("Resultados da Sensibilidade")
     st.dataframe(df_sens)
 
-    fig, ax = plt.subplots(figsize=(8, 5))
-    sns.lineplot(df_sens, x="Capacidade %", y="Valor Ótimo", marker="o", ax=ax)
-    ax.set_title("Variação do Valor Ótimo conforme a Capacidade")
-    ax.set_xlabel("% da Capacidade Total")
-    ax.set_ylabel("Valor Ótimo (Z)")
-    st.pyplot(fig)
+    from src.plotting import plot_sensibilidade
+    st.pyplot(plot_sensibilidade(df_sens))
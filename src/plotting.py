@@ -0,0 +1,30 @@
+"""
+Gráficos do dashboard.
+
+Importa matplotlib e seaborn no topo: só deve ser importado nas páginas que
+desenham gráficos, para não pesar na inicialização do app e do solver.
+"""
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+
+def plot_distribuicoes(df_filtered):
+    """Histogramas de Valor e Peso e dispersão Peso vs Valor (cor = Ratio)."""
+    fig, ax = plt.subplots(1, 3, figsize=(18, 5))
+    sns.histplot(df_filtered['Valor'], kde=True, ax=ax[0], color='blue')
+    ax[0].set_title("Distribuição de Valor")
+    sns.histplot(df_filtered['Peso'], kde=True, ax=ax[1], color='red')
+    ax[1].set_title("Distribuição de Peso")
+    sns.scatterplot(df_filtered, x="Peso", y="Valor", hue="Ratio", ax=ax[2])
+    ax[2].set_title("Peso vs Valor (Cor = Ratio)")
+    return fig
+
+
+def plot_sensibilidade(df_sens):
+    """Variação do valor ótimo conforme a capacidade."""
+    fig, ax = plt.subplots(figsize=(8, 5))
+    sns.lineplot(df_sens, x="Capacidade %", y="Valor Ótimo", marker="o", ax=ax)
+    ax.set_title("Variação do Valor Ótimo conforme a Capacidade")
+    ax.set_xlabel("% da Capacidade Total")
+    ax.set_ylabel("Valor Ótimo (Z)")
+    return fig
@@ -1,33 +1,6 @@
 import time
-from collections import namedtuple
 
-# Namedtuple para facilitar a leitura do código
-Item = namedtuple('Item', ['name', 'value', 'weight', 'ratio'])
-
-def calculate_bound(items, W, n, level, current_weight, current_value):
-    """
-    Calcula o Limite Superior (Bound) usando a relaxação linear (método guloso).
-    Assume que os 'items' já estão ordenados por ratio (valor/peso).
-    """
-    if current_weight > W:
-        return 0  # Inviável
-
-    bound = current_value
-    total_weight = current_weight
-    
-    # Itera a partir do item 'level'
-    for i in range(level, n):
-        # Se o item cabe inteiramente
-        if total_weight + items[i].weight <= W:
-            total_weight += items[i].weight
-            bound += items[i].value
-        else:
-            # Se não cabe, pega a fração (relaxação) e para
-            remaining_capacity = W - total_weight
-            bound += items[i].ratio * remaining_capacity
-            break # Este 'break' é crucial
-            
-    return bound
+from src.solver_core import calculate_bound, items_from_dataframe
 
 def solve_knapsack_bb(df_knapsack, W_CAPACITY):
     """
@@ -38,15 +11,8 @@ def solve_knapsack_bb(df_knapsack, W_CAPACITY):
     print(f"Capacidade (W): {W_CAPACITY:.2f}")
     
     # --- 1. Preparação dos Itens ---
-    items = []
-    for _, row in df_knapsack.iterrows():
-        # Ignora itens que sozinhos já estouram o peso (poda inicial)
-        if row['Peso'] <= W_CAPACITY and row['Peso'] > 0:
-            ratio = row['Valor'] / row['Peso']
-            items.append(Item(row['Station'], row['Valor'], row['Peso'], ratio))
-
-    # Ordena por 'ratio' (valor/peso) decrescente. Essencial para o cálculo do bound.
-    items.sort(key=lambda x: x.ratio, reverse=True)
+    # Ignora itens que sozinhos já estouram o peso e ordena por ratio decrescente
+    items = items_from_dataframe(df_knapsack, W_CAPACITY)
     n = len(items)
     print(f"Itens viáveis (estações): {n}")
 
@@ -1,34 +1,7 @@
 import time
-from collections import namedtuple
 
-# Namedtuple para facilitar a leitura do código
-Item = namedtuple('Item', ['name', 'value', 'weight', 'ratio'])
-
-
-def calculate_bound(items, W, n, level, current_weight, current_value):
-    """
-    Calcula o Limite Superior (Bound) usando a relaxação linear (método guloso).
-    Assume que os 'items' já estão ordenados por ratio (valor/peso).
-    """
-    if current_weight > W:
-        return 0  # Inviável
-
-    bound = current_value
-    total_weight = current_weight
-
-    # Itera a partir do item 'level'
-    for i in range(level, n):
-        # Se o item cabe inteiramente
-        if total_weight + items[i].weight <= W:
-            total_weight += items[i].weight
-            bound += items[i].value
-        else:
-            # Se não cabe, pega a fração (relaxação) e para
-            remaining_capacity = W - total_weight
-            bound += items[i].ratio * remaining_capacity
-            break  # Este 'break' é crucial
-
-    return bound
+# Item e prepare_items são reexportados para quem já importa daqui
+from src.solver_core import Item, calculate_bound, items_from_dataframe, prepare_items
 
 
 def solve_knapsack_bb_updated(df_knapsack, W_CAPACITY,
@@ -39,16 +12,24 @@ def solve_knapsack_bb_updated(df_knapsack, W_CAPACITY,
     Resolve o Problema da Mochila 0-1 usando Branch and Bound com Busca em Profundidade (Pilha).
 
     Modificado para aceitar limites e reportar progresso via placeholders do Streamlit.
+    Adaptador para DataFrames: prepara os itens e delega a solve_items_bb_updated.
     """
 
     # --- 1. Preparação dos Itens ---
-    items = []
-    for _, row in df_knapsack.iterrows():
-        if row['Peso'] <= W_CAPACITY and row['Peso'] > 0:
-            ratio = row['Valor'] / row['Peso']
-            items.append(Item(row['Station'], row['Valor'], row['Peso'], ratio))
+    items = items_from_dataframe(df_knapsack, W_CAPACITY)
+    return solve_items_bb_updated(items, W_CAPACITY, time_limit,
+                                  max_nodes_limit, st_progress_placeholders)
+
 
-    items.sort(key=lambda x: x.ratio, reverse=True)
+def solve_items_bb_updated(items, W_CAPACITY,
+                           time_limit=60,
+                           max_nodes_limit=1_000_000_000,
+                           st_progress_placeholders=None):
+    """
+    Executa o Branch and Bound sobre itens já preparados (ver prepare_items).
+
+    Não depende de pandas, podendo ser usado diretamente por workers de processos.
+    """
     n = len(items)
 
     if n == 0:
@@ -0,0 +1,62 @@
+"""
+Núcleo leve do Branch and Bound.
+
+Este módulo não importa pandas, numpy nem matplotlib: pode ser carregado
+rapidamente por workers de processos e jobs em lote que só precisam resolver
+instâncias já preparadas.
+"""
+from collections import namedtuple
+
+# Namedtuple para facilitar a leitura do código
+Item = namedtuple('Item', ['name', 'value', 'weight', 'ratio'])
+
+
+def calculate_bound(items, W, n, level, current_weight, current_value):
+    """
+    Calcula o Limite Superior (Bound) usando a relaxação linear (método guloso).
+    Assume que os 'items' já estão ordenados por ratio (valor/peso).
+    """
+    if current_weight > W:
+        return 0  # Inviável
+
+    bound = current_value
+    total_weight = current_weight
+
+    # Itera a partir do item 'level'
+    for i in range(level, n):
+        # Se o item cabe inteiramente
+        if total_weight + items[i].weight <= W:
+            total_weight += items[i].weight
+            bound += items[i].value
+        else:
+            # Se não cabe, pega a fração (relaxação) e para
+            remaining_capacity = W - total_weight
+            bound += items[i].ratio * remaining_capacity
+            break  # Este 'break' é crucial
+
+    return bound
+
+
+def prepare_items(records, W_CAPACITY):
+    """
+    Converte registros (station, valor, peso) em uma lista de Item ordenada
+    por ratio (valor/peso) decrescente, pronta para o solver.
+    """
+    items = []
+    for name, value, weight in records:
+        # Ignora itens que sozinhos já estouram o peso (poda inicial)
+        if weight <= W_CAPACITY and weight > 0:
+            items.append(Item(name, value, weight, value / weight))
+
+    # Ordena por 'ratio' (valor/peso) decrescente. Essencial para o cálculo do bound.
+    items.sort(key=lambda x: x.ratio, reverse=True)
+    return items
+
+
+def items_from_dataframe(df_knapsack, W_CAPACITY):
+    """
+    Adaptador para DataFrames com as colunas 'Station', 'Valor' e 'Peso'.
+    Usa apenas a interface do DataFrame recebido, sem importar pandas.
+    """
+    records = df_knapsack[['Station', 'Valor', 'Peso']].itertuples(index=False, name=None)
+    return prepare_items(records, W_CAPACITY)
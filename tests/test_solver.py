@@ -6,7 +6,13 @@ import pytest
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from src.solver_bb_updated import Item, calculate_bound, solve_knapsack_bb_updated
+from src.solver_bb_updated import (
+    Item,
+    calculate_bound,
+    prepare_items,
+    solve_items_bb_updated,
+    solve_knapsack_bb_updated,
+)
 
 
 def test_calculate_bound_basic():
@@ -90,3 +96,12 @@ def test_branch_and_bound_pruning_counters():
     assert res["pruned_by_viability"] > 0
     assert res["pruned_by_bound"] > 0
     assert res["max_value"] == 14
+
+
+def test_solver_core_sem_dataframe():
+    items = prepare_items([("A", 60, 10), ("B", 100, 20), ("C", 120, 30), ("D", 1, 0)], 50)
+    assert [item.name for item in items] == ["A", "B", "C"]
+    res = solve_items_bb_updated(items, 50, time_limit=10, max_nodes_limit=100_000)
+    assert res["status"] == "Ótimo Encontrado"
+    assert abs(res["max_value"] - 220) < 1e-6
+    assert set(res["final_solution_items"]) == {"B", "C"}
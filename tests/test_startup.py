@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+MODULOS_PESADOS = ("pandas", "numpy", "matplotlib", "seaborn")
+
+# Orçamento generoso para o import do núcleo (o custo real fica em milissegundos)
+LIMITE_IMPORT_SEGUNDOS = 0.5
+
+
+def _medir_import(modulo):
+    """Importa 'modulo' num interpretador novo e retorna (tempo total em s, módulos pesados carregados)."""
+    codigo = (
+        "import sys, time\n"
+        "t0 = time.perf_counter()\n"
+        f"import {modulo}\n"
+        "t1 = time.perf_counter()\n"
+        "print(t1 - t0)\n"
+        f"print(','.join(m for m in {MODULOS_PESADOS!r} if m in sys.modules))\n"
+    )
+    saida = subprocess.run(
+        [sys.executable, "-c", codigo], cwd=RAIZ, capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    carregados = [m for m in saida[1].split(",") if m]
+    return float(saida[0]), carregados
+
+
+@pytest.mark.parametrize("modulo", ["src.solver_core", "src.solver_bb", "src.solver_bb_updated"])
+def test_solver_import_nao_carrega_modulos_pesados(modulo):
+    _, carregados = _medir_import(modulo)
+    assert carregados == []
+
+
+def test_solver_import_dentro_do_orcamento():
+    tempo, _ = _medir_import("src.solver_bb_updated")
+    assert tempo < LIMITE_IMPORT_SEGUNDOS